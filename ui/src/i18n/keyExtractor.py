@@ -8,7 +8,9 @@ src_dir = os.path.join(root_dir, "src")
 translations_dir = os.path.join(root_dir, "translations")
 en_translation_file = os.path.join(translations_dir, "en.json")
 
-translation_key_regex = r'(?<![A-Za-z0-9])t\(\s*(?:["\'`])([A-Za-z0-9_.\-\s]{2,})["\'`]\s*\)'
+translation_key_regex = re.compile(
+    r'(?<![A-Za-z0-9])t\(\s*(?:["\'`])([A-Za-z0-9_.\-\s]{2,})["\'`]\s*\)'
+)
 
 # Function to flatten a nested dictionary
 def flatten_dict(d, parent_key="", sep="."):
@@ -59,7 +61,7 @@ def find_translation_keys(directory):
                     # Ensure the file contains "i18n" before extracting keys
                     if "i18n" in content:
                         # now findall returns a list of strings, not tuples
-                        matches = re.findall(translation_key_regex, content)
+                        matches = translation_key_regex.findall(content)
                         for key in matches:
                             keys.add(key)
     return keys